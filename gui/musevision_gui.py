@@ -6,19 +6,177 @@ Apple-inspired design with clean, modern aesthetics
 
 import sys
 import os
+import re
+import asyncio
+import codecs
 import subprocess
 import threading
 import time
+import concurrent.futures
+import contextlib
+import functools
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import json
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 from tkinter.scrolledtext import ScrolledText
 
+# Repository layout, resolved once relative to this file (gui/ lives in the repo root)
+MUSEVISION_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = MUSEVISION_DIR / 'scripts'
+PROJECTS_DIR = MUSEVISION_DIR / 'projects'
+WILDCARDS_DIR = MUSEVISION_DIR / 'wildcards'
+
+# ttk theme holding all MuseVision styles
+THEME_NAME = 'apple'
+
+# Interval for flushing buffered process output into the console, and the
+# most lines handled per flush so a burst of output can't stall the UI
+OUTPUT_DRAIN_MS = 50
+OUTPUT_DRAIN_MAX_LINES = 500
+
+# Minimum interval between progress bar / status label refreshes (~30 Hz)
+PROGRESS_FLUSH_MS = 33
+
+# Seconds a 'queue status' result is reused before the agent is queried again
+QUEUE_STATUS_TTL = 3.0
+
+# Console history limit; once exceeded, the oldest lines are dropped so that
+# CONSOLE_TRIM_LINES of headroom is left
+CONSOLE_MAX_LINES = 4000
+CONSOLE_TRIM_LINES = 1000
+
+# Process output is read in chunks of OUTPUT_READ_SIZE bytes and split on '\r' as
+# well as '\n', so carriage-return progress bars arrive as separate lines. Text
+# without any line break is flushed once it reaches OUTPUT_MAX_LINE characters.
+OUTPUT_READ_SIZE = 64 * 1024
+OUTPUT_MAX_LINE = 2**20
+LINE_BREAK_PATTERN = re.compile(r'\r\n|\r|\n')
+
+# Longest edge of image-selection preview thumbnails, in pixels
+THUMB_SIZE = 200
+
+# Thumbnails per atlas image; keeps each atlas well below X11's 32767px pixmap limit
+ATLAS_MAX_THUMBS = 32
+
+# File extensions shown in the image-selection previews (lowercase, for str.endswith)
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# Decoded thumbnails kept in memory; least recently used ones are evicted first
+THUMB_CACHE_SIZE = 256
+
+# Characters not allowed in new project names (replaced with '_')
+PROJECT_NAME_SANITIZER = re.compile(r'[^\w\-_]')
+
+# Progress lines reported by gpu_optimized_agent.py
+SUBMITTED_PATTERN = re.compile(r'Successfully submitted: (\d+)')
+JOB_PROGRESS_PATTERN = re.compile(r'\((\d+)/(\d+)\)')
+# Every status line contains one of these; anything else is plain log output
+STATUS_MARKERS = ('PHASE', 'completed', 'Successfully submitted:', 'Submission Summary')
+
+# Flag -> parameter name for each gpu_optimized_agent.py subcommand; the
+# parameter is read from the param_vars entry '<name>_<tab_type>'
+COMMAND_ARGS = {
+    'explore_styles': [
+        ('--prompt', 'prompt'), ('--guidance', 'guidance'),
+        ('--dream-count', 'dream_count'), ('--n', 'n'), ('--k', 'k'),
+        ('--creativity', 'creativity'), ('--width', 'width'), ('--height', 'height'),
+        ('--strength-min', 'strength_min'), ('--strength-max', 'strength_max'),
+    ],
+    'explore_narrative': [
+        ('--guidance', 'guidance'), ('--dream-count', 'dream_count'),
+        ('--seed-count', 'seed_count'), ('--creativity', 'creativity'),
+        ('--width', 'width'), ('--height', 'height'),
+    ],
+    'refine_styles': [
+        ('--prompt', 'prompt'), ('--guidance', 'guidance'),
+        ('--dream-count', 'dream_count'), ('--test-count', 'test_count'), ('--k', 'k'),
+        ('--creativity', 'creativity'), ('--width', 'width'), ('--height', 'height'),
+        ('--strength-min', 'strength_min'), ('--strength-max', 'strength_max'),
+    ],
+}
+
 # Add the scripts directory to path for imports
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'scripts'))
+sys.path.append(str(SCRIPTS_DIR))
+
+try:
+    from PIL import Image, ImageTk
+    # Image.Resampling only exists on Pillow >= 9.1
+    THUMB_RESAMPLE = getattr(Image, 'Resampling', Image).BILINEAR
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+
+def classify_output_line(message):
+    """Classify a line of agent output as (kind, *numbers).
+    
+    Lines that carry no status information classify as ('other',).
+    """
+    if not any(marker in message for marker in STATUS_MARKERS):
+        return ('other',)
+    return _classify_status_line(message)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_status_line(message):
+    """Classify a line containing a status marker.
+    
+    Banners and status echoes repeat many times, so results are memoized;
+    plain log lines never reach the cache and cannot evict them.
+    """
+    if "PHASE 1: LLM INFERENCE" in message:
+        return ('llm_phase',)
+    elif "PHASE 2: IMAGE GENERATION" in message:
+        return ('comfyui_phase',)
+    elif "PHASE 3: CLEANUP" in message:
+        return ('cleanup_phase',)
+    elif "BATCH SUBMISSION PHASE" in message:
+        return ('batch_submission',)
+    elif "Submission Summary" in message:
+        return ('submission_summary',)
+    elif "Successfully submitted:" in message:
+        match = SUBMITTED_PATTERN.search(message)
+        if match:
+            return ('submitted', int(match.group(1)))
+    elif "Job" in message and "completed" in message:
+        match = JOB_PROGRESS_PATTERN.search(message)
+        if match:
+            return ('job_completed', int(match.group(1)), int(match.group(2)))
+    elif "JOB MONITORING PHASE" in message:
+        return ('monitoring',)
+    return ('other',)
+
+
+class _FolderChangeHandler(FileSystemEventHandler):
+    """Marks a watched image folder dirty whenever its contents change"""
+    
+    def __init__(self, gui, folder_path):
+        super().__init__()
+        self.gui = gui
+        self.folder_path = folder_path
+    
+    def on_any_event(self, event):
+        if event.event_type in ('opened', 'closed_no_write'):
+            return  # Reads (e.g. thumbnail decoding) don't change the listing
+        # Called on the observer thread; hand the update to the Tk thread
+        try:
+            self.gui.root.after(0, self.gui._mark_folder_dirty, self.folder_path)
+        except RuntimeError:
+            pass  # Main loop has already shut down
+
 
 class AppleStyleGUI:
     """Main MuseVision GUI with Apple-inspired aesthetics"""
@@ -53,103 +211,178 @@ class AppleStyleGUI:
             'error': '#FF453A',        # Red
             'border': '#48484A'        # Dark border
         }
+        # Attribute copies (self._c_accent, ...) for widget-building and drawing code
+        for name, value in self.colors.items():
+            setattr(self, f'_c_{name}', value)
         
         # Default values (must be set before setup_ui)
-        self.default_project_dir = "/home/mitchellflautt/MuseVision/projects"
+        self.default_project_dir = str(PROJECTS_DIR)
         self.default_output_dir = ""
-        self.gpu_script_path = "/home/mitchellflautt/MuseVision/scripts/gpu_optimized_agent.py"
-        self.current_process: Optional[subprocess.Popen] = None
+        self.gpu_script_path = str(SCRIPTS_DIR / 'gpu_optimized_agent.py')
+        self.current_process: Optional[asyncio.subprocess.Process] = None
         self.monitoring_thread: Optional[threading.Thread] = None
+        self.processing_phase = "idle"
+        
+        # Processes run on one shared asyncio loop; their output lines are
+        # buffered here and drained on the Tk thread every OUTPUT_DRAIN_MS
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._output_lines: deque = deque()
+        # Bumped per run and on stop so a stale run's completion is ignored
+        self._run_generation = 0
+        self._drain_after_id: Optional[str] = None
+        # Whether word wrap is suspended while a burst of output is drained
+        self._console_unwrapped = False
+        # Progress / status parsed from output, applied by _flush_progress
+        self._pending_progress: Optional[float] = None
+        self._pending_status: Optional[str] = None
+        self._progress_after_id: Optional[str] = None
+        # (time.monotonic() timestamp, stdout) of the last 'queue status' query
+        self._queue_status_cache: Tuple[float, Optional[str]] = (0.0, None)
+        
+        # Path objects built once and reused by callbacks
+        self._project_root = PROJECTS_DIR
+        self._scandir_projects = functools.partial(os.scandir, str(self._project_root))
+        
+        # Canvases waiting for a scrollregion update on the next idle cycle
+        self._pending_sr: set = set()
+        self._sr_after_id: Optional[str] = None
+        # Pending update_canvas_scrolling after a tab change; rapid switches reuse one
+        self._tab_after_id: Optional[str] = None
+        # Scrollable canvas of each built tab, refreshed by update_canvas_scrolling
+        self._scroll_canvases: List[tk.Canvas] = []
+        
+        # Project name -> directory mtime from the last refresh_projects scan
+        self._project_cache: Dict[str, float] = {}
+        # Project name -> {subdir: created output dir}, invalidated on mtime change
+        self._output_dir_cache: Dict[str, Dict[str, str]] = {}
+        
+        # Thumbnails are decoded on worker threads and cached by (abspath, mtime_ns)
+        # in LRU order. Each preview card draws them through a few shared atlas PhotoImages.
+        self._thumb_pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 4)
+        self._thumb_cache: OrderedDict = OrderedDict()
+        self._thumb_atlases: Dict[str, List[Any]] = {}
+        self._display_gen: Dict[str, int] = {}
+        # Image card -> folder listing it currently shows, so unchanged refreshes are no-ops
+        self._displayed_listing: Dict[str, List[os.DirEntry]] = {}
+        
+        # Directory path -> (mtime_ns, filtered entries) from the last _cached_scandir.
+        # Watched image folders reuse their entry until the watcher drops it.
+        self._dir_cache: Dict[str, Tuple[int, List[os.DirEntry]]] = {}
+        # Watched folder path -> watchdog ObservedWatch, so it can be unscheduled
+        self._watched_folders: Dict[str, Any] = {}
+        self._observer = None
+        
+        # Nesting depth of _batch_updates() and whether a project change is deferred
+        self._batch_depth = 0
+        self._project_change_pending = False
+        # Project name on_project_changed last applied, to skip no-op typed edits
+        self._applied_project: Optional[str] = None
+        
+        # Dimension preset per tab: requested by set_dimensions / currently drawn.
+        # Redraws for a tab are coalesced into one idle callback.
+        self._requested_dimension: Dict[str, str] = {}
+        self._shown_dimension: Dict[str, str] = {}
+        self._dimension_after_ids: Dict[str, str] = {}
+        
+        # Canvases that scroll with the mouse wheel -> 'vertical' / 'horizontal'
+        self._wheel_targets: Dict[tk.Canvas, str] = {}
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind(sequence, self._on_wheel)
         
         self.setup_style()
         self.setup_ui()
     
     def setup_style(self):
         """Configure ttk styles with Apple aesthetics"""
-        style = ttk.Style()
-        
-        # Configure notebook (tabs)
-        style.configure("Apple.TNotebook", 
-                       background=self.colors['bg'],
-                       borderwidth=0)
-        style.configure("Apple.TNotebook.Tab",
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['text'],
-                       padding=[20, 12],
-                       borderwidth=1,
-                       focuscolor='none')
-        style.map("Apple.TNotebook.Tab",
-                 background=[('selected', self.colors['accent']),
-                            ('active', self.colors['accent_hover'])],
-                 foreground=[('selected', 'white'),
-                            ('active', 'white')])
-        
-        # Configure buttons
-        style.configure("Apple.TButton",
-                       background=self.colors['accent'],
-                       foreground='white',
-                       borderwidth=0,
-                       focuscolor='none',
-                       padding=[20, 12])
-        style.map("Apple.TButton",
-                 background=[('active', self.colors['accent_hover'])])
-        
-        # Configure labels
-        style.configure("Apple.TLabel",
-                       background=self.colors['bg'],
-                       foreground=self.colors['text'])
-        style.configure("AppleSecondary.TLabel",
-                       background=self.colors['bg'],
-                       foreground=self.colors['text_secondary'])
-        style.configure("AppleMuted.TLabel",
-                       background=self.colors['bg'],
-                       foreground=self.colors['text_muted'])
-        
-        # Configure frames
-        style.configure("Apple.TFrame", background=self.colors['bg'])
-        style.configure("AppleCard.TFrame", 
-                       background=self.colors['card_bg'],
-                       relief='flat',
-                       borderwidth=1)
-        
-        # Try to add rounded corners (limited support in tkinter)
-        style.configure("RoundedCard.TFrame", 
-                       background=self.colors['card_bg'],
-                       relief='flat',
-                       borderwidth=0)
-        
-        # Configure entries for dark theme
-        style.configure("Apple.TEntry",
-                       fieldbackground=self.colors['card_bg'],
-                       foreground=self.colors['text'],
-                       borderwidth=1,
-                       insertcolor=self.colors['text'])
-        
-        # Configure combobox for dark theme
-        style.configure("Apple.TCombobox",
-                       fieldbackground=self.colors['card_bg'],
-                       foreground=self.colors['text'],
-                       background=self.colors['card_bg'],
-                       borderwidth=1,
-                       insertcolor=self.colors['text'])
-        
-        # Configure checkbutton for dark theme
-        style.configure("Apple.TCheckbutton",
-                       background=self.colors['card_bg'],
-                       foreground=self.colors['text'],
-                       focuscolor='none')
+        c = self.colors
+        
+        # Named fonts shared by every widget instead of per-widget font tuples
+        self.fonts = {
+            'heading': tkfont.Font(family='Arial', size=24, weight='bold'),
+            'title': tkfont.Font(family='Arial', size=16, weight='bold'),
+            'label': tkfont.Font(family='Arial', size=13),
+            'body': tkfont.Font(family='Arial', size=12),
+            'body_bold': tkfont.Font(family='Arial', size=12, weight='bold'),
+            'description': tkfont.Font(family='Arial', size=11),
+            'small': tkfont.Font(family='Arial', size=10),
+            'caption': tkfont.Font(family='Arial', size=9),
+            'numeric': tkfont.Font(family='SF Pro Display', size=12),
+            'mono': tkfont.Font(family='Courier', size=10),
+            'mono_entry': tkfont.Font(family='Courier', size=11),
+        }
+        
+        # (style name, configure options, map options) - one pass per style
+        style_specs = [
+            # Notebook (tabs)
+            ("Apple.TNotebook",
+             {'background': c['bg'], 'borderwidth': 0}, None),
+            ("Apple.TNotebook.Tab",
+             {'background': c['card_bg'], 'foreground': c['text'],
+              'padding': [20, 12], 'borderwidth': 1, 'focuscolor': 'none'},
+             {'background': [('selected', c['accent']), ('active', c['accent_hover'])],
+              'foreground': [('selected', 'white'), ('active', 'white')]}),
+            
+            # Buttons
+            ("Apple.TButton",
+             {'background': c['accent'], 'foreground': 'white', 'borderwidth': 0,
+              'focuscolor': 'none', 'padding': [20, 12]},
+             {'background': [('active', c['accent_hover'])]}),
+            
+            # Labels
+            ("Apple.TLabel",
+             {'background': c['bg'], 'foreground': c['text']}, None),
+            ("AppleSecondary.TLabel",
+             {'background': c['bg'], 'foreground': c['text_secondary']}, None),
+            
+            # Frames - plain frames use the theme's default TFrame style;
+            # cards opt in to AppleCard.TFrame
+            ("TFrame",
+             {'background': c['bg']}, None),
+            ("AppleCard.TFrame",
+             {'background': c['card_bg'], 'relief': 'flat', 'borderwidth': 1}, None),
+            
+            # Entries, combobox and checkbutton for dark theme
+            ("Apple.TEntry",
+             {'fieldbackground': c['card_bg'], 'foreground': c['text'],
+              'borderwidth': 1, 'insertcolor': c['text']}, None),
+            ("Apple.TCombobox",
+             {'fieldbackground': c['card_bg'], 'foreground': c['text'],
+              'background': c['card_bg'], 'borderwidth': 1, 'insertcolor': c['text']}, None),
+            ("Apple.TCheckbutton",
+             {'background': c['card_bg'], 'foreground': c['text'], 'focuscolor': 'none'}, None),
+        ]
+        
+        # Compile every configure/map into one Tcl script and install it as the
+        # settings of a dedicated theme, created once and derived from the current one
+        commands = []
+        for name, options, maps in style_specs:
+            commands.append(f"ttk::style configure {name} " + " ".join(
+                f"-{opt} {self._tcl_word(value)}" for opt, value in options.items()))
+            if maps:
+                commands.append(f"ttk::style map {name} " + " ".join(
+                    f"-{opt} {self._tcl_word([item for pair in states for item in pair])}"
+                    for opt, states in maps.items()))
+        style = ttk.Style(self.root)
+        if THEME_NAME not in style.theme_names():
+            self.root.tk.call('ttk::style', 'theme', 'create', THEME_NAME,
+                              '-parent', style.theme_use(),
+                              '-settings', "\n".join(commands))
+        style.theme_use(THEME_NAME)
+        
+        # Aspect-ratio previews shared by every dimension preset button
+        self.render_dimension_images()
         
     def setup_ui(self):
         """Setup the main user interface"""
-        self.root.configure(bg=self.colors['bg'])
+        self.root.configure(bg=self._c_bg)
         
         # Main container with padding
-        main_frame = ttk.Frame(self.root, style="Apple.TFrame")
+        main_frame = ttk.Frame(self.root)
         main_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Title (simplified, no subtitle)
         title_label = ttk.Label(main_frame, text="MuseVision", 
-                               font=('Arial', 24, 'bold'), 
+                               font=self.fonts['heading'], 
                                style="Apple.TLabel")
         title_label.pack(pady=(0, 10))
         
@@ -160,10 +393,31 @@ class AppleStyleGUI:
         self.notebook = ttk.Notebook(main_frame, style="Apple.TNotebook")
         self.notebook.pack(fill='both', expand=True, pady=20)
         
-        # Create tabs for each function  
-        self.create_explore_styles_tab()
-        self.create_explore_narrative_tab()
-        self.create_refine_styles_tab()
+        # Create placeholder tabs; their contents are built on first selection
+        self._tab_frames = []
+        for tab_text in ("Explore Styles", "Explore Narrative", "Refine Styles"):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=tab_text)
+            self._tab_frames.append(frame)
+        
+        self._tab_builders = {
+            0: self.create_explore_styles_tab,
+            1: self.create_explore_narrative_tab,
+            2: self.create_refine_styles_tab,
+        }
+        # Per-tab output subdirectory and run command, keyed by notebook index
+        self._tab_subdir = {
+            0: 'style_explore',
+            1: 'narrative_explore',
+            2: 'style_refine',
+        }
+        self._tab_runner = {
+            0: self.run_explore_styles,
+            1: self.run_explore_narrative,
+            2: self.run_refine_styles,
+        }
+        # The first tab is visible immediately, so build it now
+        self.build_tab(0)
         
         # Bind tab change to update output directory and fix scrolling
         self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
@@ -174,20 +428,16 @@ class AppleStyleGUI:
     def setup_project_management_section(self, parent):
         """Setup enhanced project management with creation and selection"""
         # Card frame for project settings
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
         card_frame.pack(fill='x', pady=(0, 10))
         
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
-        
         # Project management title
-        ttk.Label(inner_frame, text="Project Management", 
-                 font=('Arial', 16, 'bold'),
+        ttk.Label(card_frame, text="Project Management", 
+                 font=self.fonts['title'],
                  style="Apple.TLabel").pack(anchor='w')
         
         # Project selection/creation frame
-        proj_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        proj_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         proj_frame.pack(fill='x', pady=(10, 5))
         
         # Project dropdown and controls
@@ -195,7 +445,7 @@ class AppleStyleGUI:
         proj_left_frame.pack(side='left', fill='x', expand=True)
         
         ttk.Label(proj_left_frame, text="Project:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(side='left')
+                 font=self.fonts['label'], style="Apple.TLabel").pack(side='left')
         
         # Project selection combobox
         self.project_var = tk.StringVar()
@@ -215,14 +465,14 @@ class AppleStyleGUI:
         self.refresh_projects()
         
         # Output directory selection with auto-update
-        output_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        output_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         output_frame.pack(fill='x', pady=5)
         
         ttk.Label(output_frame, text="Output Directory:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(side='left')
+                 font=self.fonts['label'], style="Apple.TLabel").pack(side='left')
         self.output_dir_var = tk.StringVar()
         self.output_entry = ttk.Entry(output_frame, textvariable=self.output_dir_var, 
-                                     width=65, style="Apple.TEntry", font=('Courier', 11))
+                                     width=65, style="Apple.TEntry", font=self.fonts['mono_entry'])
         self.output_entry.pack(side='left', padx=(10, 5))
         
         ttk.Button(output_frame, text="Browse", 
@@ -232,38 +482,39 @@ class AppleStyleGUI:
         ttk.Button(output_frame, text="Auto", 
                   command=self.auto_set_output_dir).pack(side='left', padx=(5, 0))
         
-        # Bind project change to auto-update output directory and refresh images
+        # Bind project change to auto-update output directory and refresh images.
+        # Programmatic project_var.set() calls invoke on_project_changed directly;
+        # a typed name is applied on Return or when the combobox loses focus.
         self.project_combo.bind('<<ComboboxSelected>>', self.on_project_changed)
-        self.project_var.trace('w', self.on_project_changed)
+        self.project_combo.bind('<Return>', self.on_project_typed)
+        self.project_combo.bind('<FocusOut>', self.on_project_typed)
     
-    def create_explore_styles_tab(self):
-        """Create the Explore Styles tab"""
-        frame = ttk.Frame(self.notebook, style="Apple.TFrame")
-        self.notebook.add(frame, text="Explore Styles")
+    def create_explore_styles_tab(self, frame):
+        """Create the Explore Styles tab contents inside its notebook frame"""
         
         # Scrollable frame
-        canvas = tk.Canvas(frame, bg=self.colors['bg'])
+        canvas = tk.Canvas(frame, bg=self._c_bg)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Apple.TFrame")
+        scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: self._schedule_scrollregion(c)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Create horizontal layout for better space utilization
-        main_layout = ttk.Frame(scrollable_frame, style="Apple.TFrame")
+        main_layout = ttk.Frame(scrollable_frame)
         main_layout.pack(fill='both', expand=True, padx=20)
         
         # Left column for main parameters
-        left_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        left_column = ttk.Frame(main_layout)
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         # Right column for dimensions and advanced options
-        right_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        right_column = ttk.Frame(main_layout)
         right_column.pack(side='right', fill='y', padx=(10, 0))
         
         # Parameters card in left column
@@ -276,51 +527,50 @@ class AppleStyleGUI:
             ("Creativity", "LLM creativity level (0.0-1.0)", "float", "creativity_styles", 0.7),
             ("Min LoRA Strength", "Minimum LoRA strength", "float", "strength_min_styles", 0.7),
             ("Max LoRA Strength", "Maximum LoRA strength", "float", "strength_max_styles", 0.9),
-        ])
+        ], in_column=True)
         
         # Dimensions card in right column
-        self.create_dimensions_card(right_column, "styles")
+        self.create_dimensions_card(right_column, "styles", in_column=True)
         
         # Advanced options in right column
-        self.create_advanced_options_card(right_column, "styles")
+        self.create_advanced_options_card(right_column, "styles", in_column=True)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Enable mouse wheel scrolling for this tab
         self.bind_mousewheel_scrolling(canvas, 'vertical')
+        self._scroll_canvases.append(canvas)
     
-    def create_explore_narrative_tab(self):
-        """Create the Explore Narrative tab"""
-        frame = ttk.Frame(self.notebook, style="Apple.TFrame")
-        self.notebook.add(frame, text="Explore Narrative")
+    def create_explore_narrative_tab(self, frame):
+        """Create the Explore Narrative tab contents inside its notebook frame"""
         
         # Scrollable frame
-        canvas = tk.Canvas(frame, bg=self.colors['bg'])
+        canvas = tk.Canvas(frame, bg=self._c_bg)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Apple.TFrame")
+        scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: self._schedule_scrollregion(c)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Source images section - full width at top
-        self.create_image_selection_card(scrollable_frame, "Source Images", "selected_images_narrative")
+        self.create_image_selection_card(scrollable_frame, "Source Images", "selected_images_narrative", in_column=False)
         
         # Create horizontal layout for parameters below images
-        main_layout = ttk.Frame(scrollable_frame, style="Apple.TFrame")
+        main_layout = ttk.Frame(scrollable_frame)
         main_layout.pack(fill='both', expand=True, padx=20)
         
         # Left column for main parameters
-        left_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        left_column = ttk.Frame(main_layout)
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         # Right column for dimensions and advanced options
-        right_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        right_column = ttk.Frame(main_layout)
         right_column.pack(side='right', fill='y', padx=(10, 0))
         
         # Parameters card in left column
@@ -330,51 +580,50 @@ class AppleStyleGUI:
             ("Seed Count", "Images per narrative", "int", "seed_count_narrative", 1),
             ("Creativity", "LLM creativity level (0.0-1.0)", "float", "creativity_narrative", 0.7),
             ("Per Image", "Process each source image separately (creates individual prompt sets per image)", "bool", "per_image_narrative", False),
-        ])
+        ], in_column=True)
         
         # Dimensions card in right column
-        self.create_dimensions_card(right_column, "narrative")
+        self.create_dimensions_card(right_column, "narrative", in_column=True)
         
         # Advanced options in right column
-        self.create_advanced_options_card(right_column, "narrative")
+        self.create_advanced_options_card(right_column, "narrative", in_column=True)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Enable mouse wheel scrolling for this tab
         self.bind_mousewheel_scrolling(canvas, 'vertical')
+        self._scroll_canvases.append(canvas)
     
-    def create_refine_styles_tab(self):
-        """Create the Refine Styles tab"""
-        frame = ttk.Frame(self.notebook, style="Apple.TFrame")
-        self.notebook.add(frame, text="Refine Styles")
+    def create_refine_styles_tab(self, frame):
+        """Create the Refine Styles tab contents inside its notebook frame"""
         
         # Scrollable frame
-        canvas = tk.Canvas(frame, bg=self.colors['bg'])
+        canvas = tk.Canvas(frame, bg=self._c_bg)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas, style="Apple.TFrame")
+        scrollable_frame = ttk.Frame(canvas)
         
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e, c=canvas: self._schedule_scrollregion(c)
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         # Style images selection - full width at top
-        self.create_image_selection_card(scrollable_frame, "Style Reference Images", "selected_styles_refine")
+        self.create_image_selection_card(scrollable_frame, "Style Reference Images", "selected_styles_refine", in_column=False)
         
         # Create horizontal layout for parameters below images
-        main_layout = ttk.Frame(scrollable_frame, style="Apple.TFrame")
+        main_layout = ttk.Frame(scrollable_frame)
         main_layout.pack(fill='both', expand=True, padx=20)
         
         # Left column for main parameters
-        left_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        left_column = ttk.Frame(main_layout)
         left_column.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
         # Right column for dimensions and advanced options
-        right_column = ttk.Frame(main_layout, style="Apple.TFrame")
+        right_column = ttk.Frame(main_layout)
         right_column.pack(side='right', fill='y', padx=(10, 0))
         
         # Parameters card in left column
@@ -387,38 +636,30 @@ class AppleStyleGUI:
             ("Creativity", "LLM creativity level (0.0-1.0)", "float", "creativity_refine", 0.7),
             ("Min LoRA Strength", "Minimum LoRA strength", "float", "strength_min_refine", 0.5),
             ("Max LoRA Strength", "Maximum LoRA strength", "float", "strength_max_refine", 1.0),
-        ])
+        ], in_column=True)
         
         # Dimensions card in right column
-        self.create_dimensions_card(right_column, "refine")
+        self.create_dimensions_card(right_column, "refine", in_column=True)
         
         # Advanced options in right column
-        self.create_advanced_options_card(right_column, "refine")
+        self.create_advanced_options_card(right_column, "refine", in_column=True)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
         # Enable mouse wheel scrolling for this tab
         self.bind_mousewheel_scrolling(canvas, 'vertical')
+        self._scroll_canvases.append(canvas)
     
-    def create_parameter_card(self, parent, title, parameters):
+    def create_parameter_card(self, parent, title, parameters, *, in_column=True):
         """Create a parameter input card"""
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
-        # Adjust padding based on parent context
-        if parent.winfo_class() == 'TFrame' and parent.master.winfo_class() == 'TFrame':
-            # This is in a column layout, use less horizontal padding
-            card_frame.pack(fill='x', pady=10, padx=5)
-        else:
-            # This is full-width, use more padding
-            card_frame.pack(fill='x', pady=10, padx=20)
-        
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
+        # Column layouts use less horizontal padding than full-width cards
+        card_frame.pack(fill='x', pady=10, padx=5 if in_column else 20)
         
         # Title
-        ttk.Label(inner_frame, text=title, 
-                 font=('Arial', 16, 'bold'),
+        ttk.Label(card_frame, text=title, 
+                 font=self.fonts['title'],
                  style="Apple.TLabel").pack(anchor='w', pady=(0, 10))
         
         # Store variables for later access
@@ -426,10 +667,12 @@ class AppleStyleGUI:
             self.param_vars = {}
         if not hasattr(self, 'dimension_buttons'):
             self.dimension_buttons = {}
+        if not hasattr(self, 'param_types'):
+            self.param_types = {}
         
         # Create parameter inputs
         for label, description, param_type, var_name, default_value in parameters:
-            param_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+            param_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
             param_frame.pack(fill='x', pady=5)
             
             # Label with description tooltip
@@ -437,26 +680,27 @@ class AppleStyleGUI:
             label_frame.pack(fill='x')
             
             ttk.Label(label_frame, text=f"{label}:", 
-                     font=('Arial', 13), style="Apple.TLabel").pack(side='left')
+                     font=self.fonts['label'], style="Apple.TLabel").pack(side='left')
             ttk.Label(label_frame, text=f"({description})", 
                      style="AppleSecondary.TLabel",
-                     font=('Arial', 11)).pack(side='left', padx=(5, 0))
+                     font=self.fonts['description']).pack(side='left', padx=(5, 0))
             
             # Input widget based on type
             if param_type == "text":
                 var = tk.StringVar(value=str(default_value))
                 entry = ttk.Entry(param_frame, textvariable=var, width=60, style="Apple.TEntry",
-                                 font=('Arial', 12))
+                                 font=self.fonts['body'])
                 entry.pack(pady=(5, 0))
             elif param_type == "int":
-                var = tk.IntVar(value=int(default_value))
+                # Numbers are held as text and coerced once on submit (see get_param)
+                var = tk.StringVar(value=str(int(default_value)))
                 entry = ttk.Entry(param_frame, textvariable=var, width=20, style="Apple.TEntry",
-                                 font=('SF Pro Display', 12))
+                                 font=self.fonts['numeric'])
                 entry.pack(pady=(5, 0))
             elif param_type == "float":
-                var = tk.DoubleVar(value=float(default_value))
+                var = tk.StringVar(value=str(float(default_value)))
                 entry = ttk.Entry(param_frame, textvariable=var, width=20, style="Apple.TEntry",
-                                 font=('Arial', 12))
+                                 font=self.fonts['body'])
                 entry.pack(pady=(5, 0))
             elif param_type == "bool":
                 var = tk.BooleanVar(value=bool(default_value))
@@ -464,42 +708,44 @@ class AppleStyleGUI:
                 check.pack(pady=(5, 0))
             
             self.param_vars[var_name] = var
+            self.param_types[var_name] = param_type
+    
+    def get_param(self, var_name):
+        """Read a parameter, coercing numeric text entries to their declared type"""
+        value = self.param_vars[var_name].get()
+        param_type = self.param_types.get(var_name)
+        if param_type == "int":
+            return int(value)
+        if param_type == "float":
+            return float(value)
+        return value
     
-    def create_image_selection_card(self, parent, title, var_name):
+    def create_image_selection_card(self, parent, title, var_name, *, in_column=False):
         """Create an image selection card with previews and default folder loading"""
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
-        # Adjust padding based on parent context
-        if parent.winfo_class() == 'TFrame' and parent.master.winfo_class() == 'TFrame':
-            # This is in a column layout, use less horizontal padding
-            card_frame.pack(fill='x', pady=10, padx=5)
-        else:
-            # This is full-width, use more padding
-            card_frame.pack(fill='x', pady=10, padx=20)
-        
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
+        # Column layouts use less horizontal padding than full-width cards
+        card_frame.pack(fill='x', pady=10, padx=5 if in_column else 20)
         
         # Title with folder info
-        title_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        title_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         title_frame.pack(fill='x', pady=(0, 10))
         
         ttk.Label(title_frame, text=title, 
-                 font=('Arial', 16, 'bold'),
+                 font=self.fonts['title'],
                  style="Apple.TLabel").pack(side='left')
         
         # Default folder indicator
         folder_name = "selected_images" if "narrative" in var_name else "selected_styles"
         ttk.Label(title_frame, text=f"(Auto-loads from {folder_name}/)", 
                  style="AppleSecondary.TLabel",
-                 font=('Arial', 11)).pack(side='left', padx=(10, 0))
+                 font=self.fonts['description']).pack(side='left', padx=(10, 0))
         
         # Control buttons frame
-        ctrl_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        ctrl_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         ctrl_frame.pack(fill='x', pady=(0, 10))
         
         ttk.Button(ctrl_frame, text="Refresh", 
-                  command=lambda: self.refresh_folder_images(var_name)).pack(side='left', padx=(0, 5))
+                  command=lambda: self.refresh_folder_images(var_name, force=True)).pack(side='left', padx=(0, 5))
         ttk.Button(ctrl_frame, text="Add Images", 
                   command=lambda: self.add_images(var_name)).pack(side='left', padx=5)
         ttk.Button(ctrl_frame, text="Open Folder", 
@@ -508,22 +754,15 @@ class AppleStyleGUI:
                   command=lambda: self.clear_images(var_name)).pack(side='right')
         
         # Image display frame with scrolling
-        display_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        display_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         display_frame.pack(fill='both', expand=True)
         
-        # Create canvas for image previews (larger for bigger thumbnails)
+        # Create canvas for image previews (larger for bigger thumbnails).
+        # Thumbnails are painted directly onto the canvas as image items.
         canvas = tk.Canvas(display_frame, height=240, 
-                          bg=self.colors['card_bg'],
+                          bg=self._c_card_bg,
                           highlightthickness=0)
         scrollbar_h = ttk.Scrollbar(display_frame, orient='horizontal', command=canvas.xview)
-        scrollable_img_frame = ttk.Frame(canvas, style="AppleCard.TFrame")
-        
-        scrollable_img_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_img_frame, anchor="nw")
         canvas.configure(xscrollcommand=scrollbar_h.set)
         
         canvas.pack(side="top", fill="both", expand=True)
@@ -534,7 +773,6 @@ class AppleStyleGUI:
         
         # Store references
         setattr(self, f"{var_name}_canvas", canvas)
-        setattr(self, f"{var_name}_scrollable_frame", scrollable_img_frame)
         
         # Track selected images
         self.param_vars = getattr(self, 'param_vars', {})
@@ -543,28 +781,19 @@ class AppleStyleGUI:
         # Auto-load images from default folder
         self.refresh_folder_images(var_name)
     
-    def create_dimensions_card(self, parent, tab_type):
+    def create_dimensions_card(self, parent, tab_type, *, in_column=True):
         """Create dimension presets card"""
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
-        # Adjust padding based on parent context
-        if parent.winfo_class() == 'TFrame' and parent.master.winfo_class() == 'TFrame':
-            # This is in a column layout, use less horizontal padding
-            card_frame.pack(fill='x', pady=10, padx=5)
-        else:
-            # This is full-width, use more padding
-            card_frame.pack(fill='x', pady=10, padx=20)
-        
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
+        # Column layouts use less horizontal padding than full-width cards
+        card_frame.pack(fill='x', pady=10, padx=5 if in_column else 20)
         
         # Title
-        ttk.Label(inner_frame, text="Image Dimensions", 
-                 font=('Arial', 16, 'bold'),
+        ttk.Label(card_frame, text="Image Dimensions", 
+                 font=self.fonts['title'],
                  style="Apple.TLabel").pack(anchor='w', pady=(0, 10))
         
         # Dimension controls frame
-        dim_controls_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        dim_controls_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         dim_controls_frame.pack(fill='x', pady=5)
         
         # Preset buttons
@@ -572,7 +801,7 @@ class AppleStyleGUI:
         preset_frame.pack(fill='x', pady=(0, 10))
         
         ttk.Label(preset_frame, text="Quick Presets:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(anchor='w')
+                 font=self.fonts['label'], style="Apple.TLabel").pack(anchor='w')
         
         btn_frame = ttk.Frame(preset_frame, style="AppleCard.TFrame")
         btn_frame.pack(fill='x', pady=(5, 0))
@@ -592,66 +821,107 @@ class AppleStyleGUI:
         width_frame.pack(side='left', padx=(0, 20))
         
         ttk.Label(width_frame, text="Width:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(anchor='w')
-        width_var = tk.IntVar(value=720)
+                 font=self.fonts['label'], style="Apple.TLabel").pack(anchor='w')
+        width_var = tk.StringVar(value="720")
         ttk.Entry(width_frame, textvariable=width_var, width=10, style="Apple.TEntry",
-                 font=('Arial', 12)).pack(pady=(5, 0))
+                 font=self.fonts['body']).pack(pady=(5, 0))
         self.param_vars[f"width_{tab_type}"] = width_var
+        self.param_types[f"width_{tab_type}"] = "int"
         
         # Height
         height_frame = ttk.Frame(manual_frame, style="AppleCard.TFrame")
         height_frame.pack(side='left')
         
         ttk.Label(height_frame, text="Height:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(anchor='w')
-        height_var = tk.IntVar(value=1280)
+                 font=self.fonts['label'], style="Apple.TLabel").pack(anchor='w')
+        height_var = tk.StringVar(value="1280")
         ttk.Entry(height_frame, textvariable=height_var, width=10, style="Apple.TEntry",
-                 font=('Arial', 12)).pack(pady=(5, 0))
+                 font=self.fonts['body']).pack(pady=(5, 0))
         self.param_vars[f"height_{tab_type}"] = height_var
+        self.param_types[f"height_{tab_type}"] = "int"
+    
+    @staticmethod
+    def _tcl_word(value):
+        """Format a style option value as a single Tcl word"""
+        if isinstance(value, (list, tuple)):
+            return "{" + " ".join(str(item) for item in value) + "}"
+        return str(value)
+    
+    def render_dimension_images(self):
+        """Pre-render the aspect-ratio preview images shared by all dimension buttons"""
+        self._dim_imgs = {}
+        for is_horizontal in (True, False):
+            img_width = 60 if is_horizontal else 40
+            img_height = 40 if is_horizontal else 60
+            for selected in (False, True):
+                self._dim_imgs[(is_horizontal, selected)] = self._render_dimension_image(
+                    img_width, img_height, selected)
+    
+    def _render_dimension_image(self, img_width, img_height, selected):
+        """Draw one aspect-ratio rectangle into a PhotoImage with a single put()"""
+        rect_margin = 8
+        if selected:
+            # Selected style - thick accent outline over a stippled accent fill
+            outline, border, fill = self._c_accent, 3, self._c_accent
+        else:
+            # Unselected style - simple outline
+            outline, border, fill = self._c_border, 2, self._c_bg
+        background = self._c_card_bg
+        
+        x0, y0 = rect_margin, rect_margin
+        x1, y1 = img_width - rect_margin, img_height - rect_margin
+        rows = []
+        for y in range(img_height):
+            row = []
+            for x in range(img_width):
+                if not (x0 <= x < x1 and y0 <= y < y1):
+                    row.append(background)
+                elif x < x0 + border or x >= x1 - border or y < y0 + border or y >= y1 - border:
+                    row.append(outline)
+                elif selected and (x + 2 * y) % 4:
+                    # Emulate Tk's gray25 stipple: only every fourth pixel is filled
+                    row.append(background)
+                else:
+                    row.append(fill)
+            rows.append("{" + " ".join(row) + "}")
+        
+        img = tk.PhotoImage(width=img_width, height=img_height)
+        img.put(" ".join(rows))
+        return img
     
     def create_dimension_button(self, parent, text, width, height, tab_type, is_horizontal):
         """Create a visual dimension button that shows the aspect ratio"""
         btn_frame = ttk.Frame(parent, style="AppleCard.TFrame")
         btn_frame.pack(side='left', padx=5, pady=2)
         
-        # Create a canvas to draw the visual representation
-        canvas_width = 60 if is_horizontal else 40
-        canvas_height = 40 if is_horizontal else 60
-        
-        canvas = tk.Canvas(btn_frame, width=canvas_width, height=canvas_height, 
-                          bg=self.colors['card_bg'], highlightthickness=1,
-                          highlightbackground=self.colors['border'])
-        canvas.pack()
-        
-        # Draw rectangle representing the aspect ratio
-        rect_margin = 8
-        rect_width = canvas_width - (rect_margin * 2)
-        rect_height = canvas_height - (rect_margin * 2)
+        # Show the shared pre-rendered aspect-ratio image
+        preview = tk.Label(btn_frame, image=self._dim_imgs[(is_horizontal, False)],
+                           bg=self._c_card_bg, borderwidth=0,
+                           highlightthickness=1,
+                           highlightbackground=self._c_border)
+        preview.pack()
         
-        # Store canvas and button info for later updates
+        # Store preview and button info for later updates
         button_key = f"{tab_type}_{width}x{height}"
         if tab_type not in self.dimension_buttons:
             self.dimension_buttons[tab_type] = {}
         
         self.dimension_buttons[tab_type][button_key] = {
-            'canvas': canvas,
+            'preview': preview,
             'width': width,
             'height': height,
-            'rect_coords': (rect_margin, rect_margin, rect_margin + rect_width, rect_margin + rect_height)
+            'is_horizontal': is_horizontal,
         }
         
-        # Draw initial rectangle
-        self.update_dimension_button_style(tab_type, button_key, selected=False)
-        
         # Add click binding
         def on_click(event):
             self.set_dimensions(width, height, tab_type)
         
-        canvas.bind("<Button-1>", on_click)
+        preview.bind("<Button-1>", on_click)
         
         # Add label below
-        ttk.Label(btn_frame, text=text, style="AppleMuted.TLabel",
-                 font=('Arial', 9)).pack(pady=(2, 0))
+        ttk.Label(btn_frame, text=text, style="Apple.TLabel", foreground=self._c_text_muted,
+                 font=self.fonts['caption']).pack(pady=(2, 0))
     
     def update_dimension_button_style(self, tab_type, button_key, selected=False):
         """Update dimension button visual style"""
@@ -659,55 +929,46 @@ class AppleStyleGUI:
             return
         
         button_info = self.dimension_buttons[tab_type][button_key]
-        canvas = button_info['canvas']
-        coords = button_info['rect_coords']
-        
-        # Clear canvas
-        canvas.delete("all")
-        
-        if selected:
-            # Selected style - outlined with accent color and filled
-            canvas.create_rectangle(*coords, outline=self.colors['accent'], width=3, 
-                                   fill=self.colors['accent'], stipple='gray25')
-        else:
-            # Unselected style - simple outline
-            canvas.create_rectangle(*coords, outline=self.colors['border'], width=2, 
-                                   fill=self.colors['bg'])
+        button_info['preview'].configure(
+            image=self._dim_imgs[(button_info['is_horizontal'], selected)])
     
     def set_dimensions(self, width, height, tab_type):
         """Set dimensions from preset buttons with visual feedback"""
         self.param_vars[f"width_{tab_type}"].set(width)
         self.param_vars[f"height_{tab_type}"].set(height)
         
-        # Update button visual states
-        if tab_type in self.dimension_buttons:
-            selected_key = f"{tab_type}_{width}x{height}"
-            for button_key in self.dimension_buttons[tab_type]:
-                is_selected = (button_key == selected_key)
-                self.update_dimension_button_style(tab_type, button_key, is_selected)
+        # Update button visual states once the current event has been handled
+        self._requested_dimension[tab_type] = f"{tab_type}_{width}x{height}"
+        if tab_type not in self._dimension_after_ids:
+            self._dimension_after_ids[tab_type] = self.root.after_idle(
+                self._apply_dimension_selection, tab_type)
     
-    def create_advanced_options_card(self, parent, tab_type):
-        """Create advanced options card"""
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
-        # Adjust padding based on parent context
-        if parent.winfo_class() == 'TFrame' and parent.master.winfo_class() == 'TFrame':
-            # This is in a column layout, use less horizontal padding
-            card_frame.pack(fill='x', pady=10, padx=5)
-        else:
-            # This is full-width, use more padding
-            card_frame.pack(fill='x', pady=10, padx=20)
+    def _apply_dimension_selection(self, tab_type):
+        """Restyle only the previously shown and newly requested preset buttons"""
+        del self._dimension_after_ids[tab_type]
+        old_key = self._shown_dimension.get(tab_type)
+        new_key = self._requested_dimension[tab_type]
+        if old_key == new_key:
+            return
         
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
+        if old_key is not None:
+            self.update_dimension_button_style(tab_type, old_key, False)
+        self.update_dimension_button_style(tab_type, new_key, True)
+        self._shown_dimension[tab_type] = new_key
+    
+    def create_advanced_options_card(self, parent, tab_type, *, in_column=True):
+        """Create advanced options card"""
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
+        # Column layouts use less horizontal padding than full-width cards
+        card_frame.pack(fill='x', pady=10, padx=5 if in_column else 20)
         
         # Title
-        ttk.Label(inner_frame, text="Advanced Options", 
-                 font=('Arial', 16, 'bold'),
+        ttk.Label(card_frame, text="Advanced Options", 
+                 font=self.fonts['title'],
                  style="Apple.TLabel").pack(anchor='w', pady=(0, 10))
         
         # Wildcards section
-        wild_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        wild_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         wild_frame.pack(fill='x', pady=5)
         
         # Wildcards dropdown
@@ -715,7 +976,7 @@ class AppleStyleGUI:
         wild_header_frame.pack(fill='x')
         
         ttk.Label(wild_header_frame, text="Wildcards:", 
-                 font=('Arial', 13), style="Apple.TLabel").pack(side='left')
+                 font=self.fonts['label'], style="Apple.TLabel").pack(side='left')
         
         # Get available wildcard files
         wildcard_options = self.get_wildcard_options()
@@ -723,6 +984,9 @@ class AppleStyleGUI:
         wildcard_combo = ttk.Combobox(wild_header_frame, textvariable=wildcard_var,
                                      values=wildcard_options, state="readonly",
                                      width=25, style="Apple.TCombobox")
+        # Re-list when opened so wildcard files added while the app runs show up
+        wildcard_combo.configure(postcommand=lambda: wildcard_combo.configure(
+            values=self.get_wildcard_options()))
         wildcard_combo.pack(side='left', padx=(10, 0))
         
         self.param_vars[f"wildcards_{tab_type}"] = wildcard_var
@@ -730,78 +994,104 @@ class AppleStyleGUI:
         # Info label
         ttk.Label(wild_header_frame, text="(Select specific wildcard file or None)", 
                  style="AppleSecondary.TLabel",
-                 font=('Arial', 11)).pack(side='left', padx=(10, 0))
+                 font=self.fonts['description']).pack(side='left', padx=(10, 0))
         
         # Keep ComfyUI running (moved up since we removed timeout)
         keep_running_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(inner_frame, text="Keep ComfyUI running after completion",
+        ttk.Checkbutton(card_frame, text="Keep ComfyUI running after completion",
                        style="Apple.TCheckbutton",
                        variable=keep_running_var).pack(anchor='w', pady=(15, 0))
         self.param_vars[f"keep_comfyui_running_{tab_type}"] = keep_running_var
     
     def bind_mousewheel_scrolling(self, canvas, direction):
-        """Bind mouse wheel scrolling to a canvas"""
-        def _on_mousewheel(event):
-            if direction == 'vertical':
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            else:  # horizontal
-                canvas.xview_scroll(int(-1*(event.delta/120)), "units")
-        
-        def _on_button4(event):
-            if direction == 'vertical':
-                canvas.yview_scroll(-1, "units")
-            else:
-                canvas.xview_scroll(-1, "units")
-        
-        def _on_button5(event):
-            if direction == 'vertical':
-                canvas.yview_scroll(1, "units") 
-            else:
-                canvas.xview_scroll(1, "units")
-        
-        canvas.bind("<MouseWheel>", _on_mousewheel)  # Windows/macOS
-        canvas.bind("<Button-4>", _on_button4)       # Linux scroll up
-        canvas.bind("<Button-5>", _on_button5)       # Linux scroll down
+        """Register a canvas with the root-level mouse wheel dispatcher"""
+        self._wheel_targets[canvas] = direction
+    
+    def _on_wheel(self, event):
+        """Scroll the innermost registered canvas under the pointer"""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except (KeyError, tk.TclError):
+            return  # Pointer is over a non-Tkinter window (e.g. a combobox popdown)
         
-        # Also bind to the scrollable frame inside the canvas
-        def bind_to_children(widget):
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            widget.bind("<Button-4>", _on_button4)
-            widget.bind("<Button-5>", _on_button5)
-            for child in widget.winfo_children():
-                bind_to_children(child)
+        while widget is not None and widget not in self._wheel_targets:
+            widget = widget.master
+        if widget is None:
+            return
         
-        # Bind after a small delay to ensure widgets are created
-        self.root.after(100, lambda: bind_to_children(canvas))
+        if event.num == 4:      # Linux scroll up
+            units = -1
+        elif event.num == 5:    # Linux scroll down
+            units = 1
+        else:                   # Windows/macOS
+            units = int(-1*(event.delta/120))
+        
+        if self._wheel_targets[widget] == 'vertical':
+            widget.yview_scroll(units, "units")
+        else:  # horizontal
+            widget.xview_scroll(units, "units")
+    
+    def _schedule_scrollregion(self, canvas):
+        """Queue a scrollregion update, coalescing bursts of <Configure> events"""
+        self._pending_sr.add(canvas)
+        if self._sr_after_id is None:
+            self._sr_after_id = self.root.after_idle(self._flush_scrollregions)
+    
+    def _flush_scrollregions(self):
+        """Apply pending scrollregion updates once per idle cycle"""
+        self._sr_after_id = None
+        pending, self._pending_sr = self._pending_sr, set()
+        for canvas in pending:
+            try:
+                canvas.configure(scrollregion=canvas.bbox("all"))
+            except tk.TclError:
+                pass  # Canvas was destroyed before the idle callback ran
+    
+    def _cached_scandir(self, path, predicate, *, newest_first=False):
+        """List the entries of path matching predicate, sorted by name
+        (or by modification time, newest first).
+        
+        The listing is cached and only rescanned when the directory's mtime changes.
+        """
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._dir_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        with os.scandir(path) as it:
+            entries = [entry for entry in it if predicate(entry)]
+        if newest_first:
+            # DirEntry caches its stat result, so each file is only stat'ed once
+            entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+        else:
+            entries.sort(key=lambda entry: entry.name)
+        self._dir_cache[path] = (mtime, entries)
+        return entries
     
     def get_wildcard_options(self):
-        """Get list of available wildcard files"""
-        wildcards_dir = "/home/mitchellflautt/MuseVision/wildcards"
+        """Get list of available wildcard files (rescanned only when the directory changes)"""
         options = ["None", "All Wildcards"]
         
-        if os.path.exists(wildcards_dir):
-            try:
-                for file in os.listdir(wildcards_dir):
-                    if file.endswith('.txt'):
-                        # Remove .txt extension for display
-                        options.append(file[:-4])
-            except Exception as e:
-                print(f"Error reading wildcards directory: {e}")
+        try:
+            entries = self._cached_scandir(
+                str(WILDCARDS_DIR), lambda e: e.is_file() and e.name.endswith('.txt'))
+            # Remove .txt extension for display
+            options.extend(entry.name[:-4] for entry in entries)
+        except FileNotFoundError:
+            pass  # No wildcards directory
+        except Exception as e:
+            print(f"Error reading wildcards directory: {e}")
         
         return options
     
     def setup_control_panel(self, parent):
         """Setup the control panel with action buttons and status"""
         # Control panel card
-        card_frame = ttk.Frame(parent, style="AppleCard.TFrame")
+        card_frame = ttk.Frame(parent, style="AppleCard.TFrame", padding=(20, 15))
         card_frame.pack(fill='x', pady=(10, 0))
         
-        # Inner padding
-        inner_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
-        inner_frame.pack(fill='x', padx=20, pady=15)
-        
         # Action buttons
-        btn_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        btn_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         btn_frame.pack(fill='x', pady=(0, 10))
         
         self.run_btn = ttk.Button(btn_frame, text="▶ Run Process", 
@@ -822,17 +1112,18 @@ class AppleStyleGUI:
         
         # Status and progress
         self.status_var = tk.StringVar(value="Ready")
-        status_label = ttk.Label(inner_frame, textvariable=self.status_var, 
-                                style="Apple.TLabel", font=('Arial', 12))
+        self._shown_status = "Ready"
+        status_label = ttk.Label(card_frame, textvariable=self.status_var, 
+                                style="Apple.TLabel", font=self.fonts['body'])
         status_label.pack(anchor='w')
         
         # Dual progress bars
-        progress_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        progress_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         progress_frame.pack(fill='x', pady=(5, 0))
         
         # Overall batch progress
         ttk.Label(progress_frame, text="Overall Progress:", 
-                 style="Apple.TLabel", font=('Arial', 10)).pack(anchor='w')
+                 style="Apple.TLabel", font=self.fonts['small']).pack(anchor='w')
         
         # Create frame with specific height for overall progress
         overall_frame = ttk.Frame(progress_frame, style="AppleCard.TFrame", height=25)
@@ -841,10 +1132,11 @@ class AppleStyleGUI:
         
         self.overall_progress = ttk.Progressbar(overall_frame, mode='determinate')
         self.overall_progress.pack(fill='both', expand=True)
+        self._shown_progress = 0.0
         
         # Current job progress
         ttk.Label(progress_frame, text="Current Job:", 
-                 style="Apple.TLabel", font=('Arial', 10)).pack(anchor='w')
+                 style="Apple.TLabel", font=self.fonts['small']).pack(anchor='w')
         
         # Create frame with specific height for current progress
         current_frame = ttk.Frame(progress_frame, style="AppleCard.TFrame", height=20)
@@ -853,23 +1145,24 @@ class AppleStyleGUI:
         
         self.current_progress = ttk.Progressbar(current_frame, mode='indeterminate')
         self.current_progress.pack(fill='both', expand=True)
+        self._indeterminate_running = False
         
         # Keep reference to old progress for compatibility
         self.progress = self.overall_progress
         
         # Console output
-        console_frame = ttk.Frame(inner_frame, style="AppleCard.TFrame")
+        console_frame = ttk.Frame(card_frame, style="AppleCard.TFrame")
         console_frame.pack(fill='both', expand=True, pady=(10, 0))
         
         ttk.Label(console_frame, text="Console Output:", 
-                 style="Apple.TLabel", font=('Arial', 12, 'bold')).pack(anchor='w')
+                 style="Apple.TLabel", font=self.fonts['body_bold']).pack(anchor='w')
         
         self.console_text = ScrolledText(console_frame, height=8, 
-                                        bg=self.colors['card_bg'],
-                                        fg=self.colors['text'],
-                                        font=('Courier', 10),
-                                        insertbackground=self.colors['text'],
-                                        selectbackground=self.colors['accent'],
+                                        bg=self._c_card_bg,
+                                        fg=self._c_text,
+                                        font=self.fonts['mono'],
+                                        insertbackground=self._c_text,
+                                        selectbackground=self._c_accent,
                                         selectforeground='white',
                                         borderwidth=1,
                                         highlightthickness=0)
@@ -880,20 +1173,27 @@ class AppleStyleGUI:
     def refresh_projects(self):
         """Refresh the project list from the projects directory"""
         projects_dir = self.default_project_dir
-        if not os.path.exists(projects_dir):
-            os.makedirs(projects_dir, exist_ok=True)
+        os.makedirs(projects_dir, exist_ok=True)
         
         try:
-            projects = [d for d in os.listdir(projects_dir) 
-                       if os.path.isdir(os.path.join(projects_dir, d))]
-            projects.sort()
+            with self._scandir_projects() as entries:
+                found = {entry.name: entry.stat().st_mtime
+                         for entry in entries if entry.is_dir()}
             
-            # Update combobox values
-            self.project_combo['values'] = projects
+            # Forget memoized output dirs for projects that changed on disk
+            for name, mtime in self._project_cache.items():
+                if found.get(name) != mtime:
+                    self._output_dir_cache.pop(name, None)
+            
+            # Only touch the combobox when the set of projects changed
+            if found.keys() != self._project_cache.keys():
+                self.project_combo['values'] = sorted(found)
+            self._project_cache = found
             
             # Set default if no current selection
-            if not self.project_var.get() and projects:
-                self.project_var.set(projects[0])
+            if not self.project_var.get() and found:
+                self.project_var.set(min(found))
+                self.on_project_changed()
                 
         except Exception as e:
             print(f"Error refreshing projects: {e}")
@@ -905,22 +1205,22 @@ class AppleStyleGUI:
         project_name = askstring("New Project", "Enter project name:")
         if project_name:
             # Clean project name (remove invalid characters)
-            import re
-            project_name = re.sub(r'[^\w\-_]', '_', project_name)
+            project_name = PROJECT_NAME_SANITIZER.sub('_', project_name)
             
-            project_dir = os.path.join(self.default_project_dir, project_name)
+            project_dir = self._project_root / project_name
             try:
-                os.makedirs(project_dir, exist_ok=True)
-                
-                # Create standard subdirectories
+                # Create standard subdirectories (and the project directory with them)
                 subdirs = ['selected_images', 'selected_styles', 'style_explore', 
                           'narrative_explore', 'style_refine']
                 for subdir in subdirs:
-                    os.makedirs(os.path.join(project_dir, subdir), exist_ok=True)
+                    os.makedirs(project_dir / subdir, exist_ok=True)
                 
-                self.refresh_projects()
-                self.project_var.set(project_name)
-                self.auto_set_output_dir()
+                # refresh_projects may also select a default project; only the
+                # final selection should trigger a reload
+                with self._batch_updates():
+                    self.refresh_projects()
+                    self.project_var.set(project_name)
+                    self.on_project_changed()
                 
                 messagebox.showinfo("Success", f"Project '{project_name}' created successfully!")
                 
@@ -934,18 +1234,55 @@ class AppleStyleGUI:
             messagebox.showwarning("No Project", "Please select a project first")
             return
             
-        project_dir = os.path.join(self.default_project_dir, project_name)
-        if os.path.exists(project_dir):
-            subprocess.run(['xdg-open', project_dir])
+        project_dir = self._project_root / project_name
+        if project_dir.exists():
+            self.open_in_file_manager(project_dir)
         else:
             messagebox.showwarning("Directory Not Found", 
                                  f"Project directory does not exist: {project_dir}")
     
+    @staticmethod
+    def open_in_file_manager(path):
+        """Open path in the platform file manager without waiting for it"""
+        path = str(path)
+        if sys.platform == 'win32':
+            os.startfile(path)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', path],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            subprocess.Popen(['xdg-open', path],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                             start_new_session=True)
+    
+    @contextlib.contextmanager
+    def _batch_updates(self):
+        """Defer on_project_changed until the outermost batch exits, then run it once"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._project_change_pending:
+                self._project_change_pending = False
+                self.on_project_changed()
+    
+    def on_project_typed(self, event=None):
+        """Apply a project name typed into the combobox, if it differs from the current one"""
+        if self.project_var.get() != self._applied_project:
+            self.on_project_changed()
+    
     def on_project_changed(self, *args):
         """Handle project selection change"""
+        if self._batch_depth:
+            self._project_change_pending = True
+            return
+        self._applied_project = self.project_var.get()
         self.auto_set_output_dir()
         # Refresh images for all tabs
         try:
+            if self._watched_folders:
+                self.unwatch_other_projects(str(self._project_root / self.project_var.get()))
             if hasattr(self, 'param_vars'):
                 for var_name in ['selected_images_narrative', 'selected_styles_refine']:
                     if var_name in self.param_vars:
@@ -953,26 +1290,37 @@ class AppleStyleGUI:
         except Exception as e:
             print(f"Error refreshing images after project change: {e}")
     
+    def build_tab(self, index):
+        """Build a tab's contents the first time it is needed"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(self._tab_frames[index])
+    
+    def current_tab_index(self):
+        """Index of the selected notebook tab"""
+        return self.notebook.index(self.notebook.select())
+    
     def on_tab_changed(self, event):
         """Handle notebook tab change"""
-        self.auto_set_output_dir()
-        # Force canvas update to fix scrolling issues
         try:
-            selected_tab = self.notebook.select()
-            selected_index = self.notebook.index(selected_tab)
-            # Update scrolling region for current tab
-            self.root.after(100, self.update_canvas_scrolling)  # Small delay to ensure tab is loaded
+            self.build_tab(self.current_tab_index())
         except Exception as e:
-            print(f"Error handling tab change: {e}")
+            print(f"Error building tab: {e}")
+        self.auto_set_output_dir()
+        # Force canvas update to fix scrolling issues, once switching settles
+        if self._tab_after_id:
+            self.root.after_cancel(self._tab_after_id)
+        # Small delay to ensure tab is loaded
+        self._tab_after_id = self.root.after(100, self.update_canvas_scrolling)
     
     def update_canvas_scrolling(self):
         """Update canvas scrolling regions for current tab"""
+        self._tab_after_id = None
         try:
-            # This will trigger a recalculation of scroll regions
-            for child in self.notebook.winfo_children():
-                for canvas in child.winfo_children():
-                    if isinstance(canvas, tk.Canvas):
-                        canvas.configure(scrollregion=canvas.bbox("all"))
+            # This will trigger a recalculation of scroll regions; hidden tabs are skipped
+            for canvas in self._scroll_canvases:
+                if canvas.winfo_viewable():
+                    canvas.configure(scrollregion=canvas.bbox("all"))
         except Exception as e:
             print(f"Error updating canvas scrolling: {e}")
     
@@ -983,24 +1331,18 @@ class AppleStyleGUI:
             return
             
         try:
-            selected_tab = self.notebook.select()
-            current_tab_text = self.notebook.tab(selected_tab, 'text')
+            subdir = self._tab_subdir.get(self.current_tab_index(), 'output')
             
-            if 'Explore Styles' in current_tab_text:
-                subdir = 'style_explore'
-            elif 'Explore Narrative' in current_tab_text:
-                subdir = 'narrative_explore'
-            elif 'Refine Styles' in current_tab_text:
-                subdir = 'style_refine'
-            else:
-                subdir = 'output'
+            project_dirs = self._output_dir_cache.setdefault(project_name, {})
+            output_dir = project_dirs.get(subdir)
+            if output_dir is None:
+                output_dir = str(self._project_root / project_name / subdir)
+                # Create directory if it doesn't exist
+                os.makedirs(output_dir, exist_ok=True)
+                project_dirs[subdir] = output_dir
             
-            output_dir = os.path.join(self.default_project_dir, project_name, subdir)
             self.output_dir_var.set(output_dir)
             
-            # Create directory if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
-            
         except Exception as e:
             print(f"Error setting auto output directory: {e}")
     
@@ -1017,7 +1359,7 @@ class AppleStyleGUI:
         """Open the output directory in file manager"""
         output_dir = self.output_dir_var.get() or self.get_default_output_dir()
         if output_dir and os.path.exists(output_dir):
-            subprocess.run(['xdg-open', output_dir])
+            self.open_in_file_manager(output_dir)
         else:
             messagebox.showwarning("Directory Not Found", 
                                  f"Output directory does not exist: {output_dir}")
@@ -1028,101 +1370,215 @@ class AppleStyleGUI:
         if not project:
             return ""
         
-        selected_tab = self.notebook.select()
-        current_tab_text = self.notebook.tab(selected_tab, 'text')
-        if 'Explore Styles' in current_tab_text:
-            return f"{self.default_project_dir}/{project}/style_explore"
-        elif 'Explore Narrative' in current_tab_text:
-            return f"{self.default_project_dir}/{project}/narrative_explore"
-        elif 'Refine Styles' in current_tab_text:
-            return f"{self.default_project_dir}/{project}/style_refine"
+        subdir = self._tab_subdir.get(self.current_tab_index())
+        if subdir:
+            return str(self._project_root / project / subdir)
         return ""
     
     
-    def refresh_folder_images(self, var_name):
-        """Load images from the default project folder"""
+    def refresh_folder_images(self, var_name, force=False):
+        """Load images from the default project folder (force rescans and redraws it)"""
         try:
             project_name = self.project_var.get()
             if not project_name:
                 return
             
             folder_name = "selected_images" if "narrative" in var_name else "selected_styles"
-            folder_path = os.path.join(self.default_project_dir, project_name, folder_name)
+            folder_path = str(self._project_root / project_name / folder_name)
             
-            if not os.path.exists(folder_path):
-                os.makedirs(folder_path, exist_ok=True)
-                return
+            os.makedirs(folder_path, exist_ok=True)
             
-            # Find image files
-            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-            images = []
-            for file in os.listdir(folder_path):
-                if any(file.lower().endswith(ext) for ext in image_extensions):
-                    images.append(os.path.join(folder_path, file))
+            # An explicit Refresh must not trust the cache or the card's current listing
+            if force:
+                self._dir_cache.pop(folder_path, None)
+                self._displayed_listing.pop(var_name, None)
             
-            # Update the display
-            self.param_vars[var_name] = images
+            # Watched folders skip even the mtime check until the watcher sees a change
+            watched = self.watch_folder(folder_path)
+            cached = self._dir_cache.get(folder_path)
+            if watched and cached is not None:
+                entries = cached[1]
+            else:
+                entries = self._cached_scandir(
+                    folder_path,
+                    lambda e: e.name.lower().endswith(IMAGE_EXTS) and e.is_file(),
+                    newest_first=True)
+            
+            # A listing reused from the cache is exactly what the card already shows
+            if entries is self._displayed_listing.get(var_name):
+                return
+            
+            # Update the display (a fresh list, since add_images extends it in place)
+            self.param_vars[var_name] = [entry.path for entry in entries]
             self.update_image_display(var_name)
+            self._displayed_listing[var_name] = entries
             
         except Exception as e:
             print(f"Error refreshing folder images: {e}")
     
+    def watch_folder(self, folder_path):
+        """Watch an image folder for changes; returns False if watching is unavailable"""
+        if not WATCHDOG_AVAILABLE:
+            return False
+        if folder_path in self._watched_folders:
+            return True
+        
+        try:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            watch = self._observer.schedule(_FolderChangeHandler(self, folder_path), folder_path)
+        except Exception as e:
+            print(f"Error watching image folder: {e}")
+            return False
+        
+        self._watched_folders[folder_path] = watch
+        return True
+    
+    def unwatch_other_projects(self, project_dir):
+        """Stop watching image folders outside project_dir and forget their listings"""
+        for folder_path in [f for f in self._watched_folders if os.path.dirname(f) != project_dir]:
+            watch = self._watched_folders.pop(folder_path)
+            self._dir_cache.pop(folder_path, None)
+            try:
+                self._observer.unschedule(watch)
+            except Exception as e:
+                print(f"Error unwatching image folder: {e}")
+    
+    def _mark_folder_dirty(self, folder_path):
+        """Force the next refresh of folder_path to rescan it"""
+        self._dir_cache.pop(folder_path, None)
+    
     def update_image_display(self, var_name):
         """Update the image preview display"""
         try:
             # Clear existing display
-            scrollable_frame = getattr(self, f"{var_name}_scrollable_frame")
-            for widget in scrollable_frame.winfo_children():
-                widget.destroy()
+            canvas = getattr(self, f"{var_name}_canvas")
+            canvas.delete("all")
             
             images = self.param_vars[var_name]
             if not images:
                 # Show placeholder
-                ttk.Label(scrollable_frame, text="No images found in folder",
-                         style="AppleMuted.TLabel",
-                         font=('Arial', 12)).pack(pady=40)
+                canvas.create_text(20, 40, text="No images found in folder", anchor='nw',
+                                   fill=self._c_text_muted, font=self.fonts['body'])
+                canvas.configure(scrollregion=(0, 0, 0, 0))
                 return
             
             # Display image previews
-            try:
-                from PIL import Image, ImageTk
-                pil_available = True
-            except ImportError:
-                pil_available = False
-            
+            slot_width = THUMB_SIZE + 10
+            placeholders = []
             for i, img_path in enumerate(images):
-                img_frame = ttk.Frame(scrollable_frame, style="AppleCard.TFrame")
-                img_frame.pack(side='left', padx=5, pady=5)
+                center_x = i * slot_width + slot_width // 2
                 
-                if pil_available:
-                    try:
-                        # Create larger thumbnail
-                        img = Image.open(img_path)
-                        img.thumbnail((200, 200), Image.Resampling.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                        
-                        img_label = tk.Label(img_frame, image=photo, 
-                                            bg=self.colors['card_bg'])
-                        img_label.image = photo  # Keep a reference
-                        img_label.pack()
-                    except Exception:
-                        # Fallback to text if image can't be loaded
-                        ttk.Label(img_frame, text="Image",
-                                 font=('Arial', 10)).pack()
-                else:
-                    # No PIL - show icon
-                    ttk.Label(img_frame, text="Image",
-                             font=('Arial', 10)).pack()
+                # Thumbnails are decoded in the background and drawn together when ready
+                placeholders.append(canvas.create_text(
+                    center_x, 5 + THUMB_SIZE // 2,
+                    text="Loading..." if PIL_AVAILABLE else "Image",
+                    fill=self._c_text_muted, font=self.fonts['small']))
                 
                 # Show filename
                 filename = os.path.basename(img_path)
-                ttk.Label(img_frame, text=filename[:15] + "..." if len(filename) > 15 else filename,
-                         style="AppleMuted.TLabel",
-                         font=('Arial', 9)).pack()
+                canvas.create_text(center_x, THUMB_SIZE + 12, anchor='n',
+                                   text=filename[:15] + "..." if len(filename) > 15 else filename,
+                                   fill=self._c_text_muted, font=self.fonts['caption'])
+            
+            # Slots are a fixed size, so the scroll region is known up front
+            canvas.configure(scrollregion=(0, 0, len(images) * slot_width, THUMB_SIZE + 30))
+            
+            self._display_gen[var_name] = generation = self._display_gen.get(var_name, 0) + 1
+            if PIL_AVAILABLE:
+                self.load_thumbnails(images, lambda thumbs: self._draw_thumbnail_atlas(
+                    var_name, generation, thumbs, placeholders))
             
         except Exception as e:
             print(f"Error updating image display: {e}")
     
+    @staticmethod
+    def _decode_thumbnail(img_path):
+        """Decode and shrink an image to preview size (runs on a worker thread)"""
+        with Image.open(img_path) as img:
+            # Let JPEG decode straight to a reduced scale, at least twice the thumbnail size
+            img.draft('RGB', (THUMB_SIZE * 2, THUMB_SIZE * 2))
+            img.thumbnail((THUMB_SIZE, THUMB_SIZE), THUMB_RESAMPLE)
+            return img.copy()
+    
+    def load_thumbnails(self, img_paths, on_ready):
+        """Collect preview-size thumbnails, decoding cache misses off the Tk thread.
+        
+        on_ready is called once on the Tk thread with a list aligned with
+        img_paths, holding None wherever an image could not be loaded.
+        """
+        thumbs = [None] * len(img_paths)
+        pending = {}
+        for i, img_path in enumerate(img_paths):
+            try:
+                key = (os.path.abspath(img_path), os.stat(img_path).st_mtime_ns)
+            except OSError:
+                continue
+            cached = self._thumb_cache.get(key)
+            if cached is not None:
+                self._thumb_cache.move_to_end(key)
+                thumbs[i] = cached
+            else:
+                pending[i] = key
+        
+        if not pending:
+            on_ready(thumbs)
+            return
+        
+        remaining = [len(pending)]
+        
+        def install(i, key, future):
+            try:
+                thumbs[i] = self._thumb_cache[key] = future.result()
+                if len(self._thumb_cache) > THUMB_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
+            except Exception:
+                pass  # Leave None so the slot falls back to text
+            remaining[0] -= 1
+            if not remaining[0]:
+                on_ready(thumbs)
+        
+        def post(i, key):
+            def on_done(future):
+                try:
+                    self.root.after(0, install, i, key, future)
+                except RuntimeError:
+                    pass  # Main loop has already shut down
+            return on_done
+        
+        for i, key in pending.items():
+            future = self._thumb_pool.submit(self._decode_thumbnail, img_paths[i])
+            future.add_done_callback(post(i, key))
+    
+    def _draw_thumbnail_atlas(self, var_name, generation, thumbs, placeholders):
+        """Paste decoded thumbnails into shared atlas images and draw them on the canvas"""
+        if self._display_gen.get(var_name) != generation:
+            return  # Display was rebuilt while the thumbnails were decoding
+        
+        canvas = getattr(self, f"{var_name}_canvas")
+        slot_width = THUMB_SIZE + 10
+        atlases = []
+        for start in range(0, len(thumbs), ATLAS_MAX_THUMBS):
+            chunk = thumbs[start:start + ATLAS_MAX_THUMBS]
+            atlas = Image.new('RGBA', (len(chunk) * slot_width, THUMB_SIZE), (0, 0, 0, 0))
+            for offset, thumb in enumerate(chunk):
+                if thumb is None:
+                    # Fallback to text if image can't be loaded
+                    canvas.itemconfigure(placeholders[start + offset], text="Image")
+                    continue
+                x = offset * slot_width + (slot_width - thumb.width) // 2
+                atlas.paste(thumb.convert('RGBA'), (x, 0))
+                canvas.delete(placeholders[start + offset])
+            
+            photo = ImageTk.PhotoImage(atlas)
+            canvas.create_image(start * slot_width, 5, image=photo, anchor='nw', tags=('thumb',))
+            atlases.append(photo)
+        
+        # Keep references so Tk doesn't drop the images
+        self._thumb_atlases[var_name] = atlases
+    
     def open_image_folder(self, var_name):
         """Open the image folder in file manager"""
         try:
@@ -1132,12 +1588,11 @@ class AppleStyleGUI:
                 return
             
             folder_name = "selected_images" if "narrative" in var_name else "selected_styles"
-            folder_path = os.path.join(self.default_project_dir, project_name, folder_name)
+            folder_path = str(self._project_root / project_name / folder_name)
             
-            if not os.path.exists(folder_path):
-                os.makedirs(folder_path, exist_ok=True)
+            os.makedirs(folder_path, exist_ok=True)
             
-            subprocess.run(['xdg-open', folder_path])
+            self.open_in_file_manager(folder_path)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open folder: {str(e)}")
@@ -1156,11 +1611,13 @@ class AppleStyleGUI:
                     current_images.append(file_path)
             
             self.param_vars[var_name] = current_images
+            self._displayed_listing.pop(var_name, None)
             self.update_image_display(var_name)
     
     def clear_images(self, var_name):
         """Clear all images from selection"""
         self.param_vars[var_name] = []
+        self._displayed_listing.pop(var_name, None)
         self.update_image_display(var_name)
     
     def get_image_list(self, var_name):
@@ -1169,8 +1626,7 @@ class AppleStyleGUI:
     
     def run_current_process(self):
         """Run the process for the current tab"""
-        selected_tab = self.notebook.select()
-        current_tab = self.notebook.tab(selected_tab, 'text')
+        runner = self._tab_runner.get(self.current_tab_index())
         
         # Validate inputs
         if not self.project_var.get().strip():
@@ -1178,43 +1634,37 @@ class AppleStyleGUI:
             return
         
         try:
-            if 'Explore Styles' in current_tab:
-                self.run_explore_styles()
-            elif 'Explore Narrative' in current_tab:
-                self.run_explore_narrative()
-            elif 'Refine Styles' in current_tab:
-                self.run_refine_styles()
+            if runner:
+                runner()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start process: {str(e)}")
             self.log_to_console(f"Error: {str(e)}")
     
-    def run_explore_styles(self):
-        """Run explore_styles process"""
-        cmd = [
-            sys.executable, self.gpu_script_path, 'explore_styles',
-            '--project', self.project_var.get(),
-            '--prompt', self.param_vars['prompt_styles'].get(),
-            '--guidance', self.param_vars['guidance_styles'].get(),
-            '--dream-count', str(self.param_vars['dream_count_styles'].get()),
-            '--n', str(self.param_vars['n_styles'].get()),
-            '--k', str(self.param_vars['k_styles'].get()),
-            '--creativity', str(self.param_vars['creativity_styles'].get()),
-            '--width', str(self.param_vars['width_styles'].get()),
-            '--height', str(self.param_vars['height_styles'].get()),
-            '--strength-min', str(self.param_vars['strength_min_styles'].get()),
-            '--strength-max', str(self.param_vars['strength_max_styles'].get()),
-        ]
-        
-        if self.param_vars['keep_comfyui_running_styles'].get():
+    def _build_cmd(self, subcommand, tab_type):
+        """Build the agent command line for subcommand from its tab's parameters"""
+        cmd = [sys.executable, self.gpu_script_path, subcommand,
+               '--project', self.project_var.get()]
+        for flag, name in COMMAND_ARGS[subcommand]:
+            cmd.extend((flag, str(self.get_param(f"{name}_{tab_type}"))))
+        return cmd
+    
+    def _add_common_options(self, cmd, tab_type):
+        """Append the advanced options shared by every tab to cmd"""
+        if self.param_vars[f'keep_comfyui_running_{tab_type}'].get():
             cmd.append('--keep-comfyui-running')
         
         # Handle wildcards
-        wildcard_selection = self.param_vars['wildcards_styles'].get()
+        wildcard_selection = self.param_vars[f'wildcards_{tab_type}'].get()
         if wildcard_selection and wildcard_selection != "None":
             if wildcard_selection == "All Wildcards":
                 cmd.extend(['--wildcards'])  # Empty wildcards means use all
             else:
                 cmd.extend(['--wildcards', wildcard_selection])
+    
+    def run_explore_styles(self):
+        """Run explore_styles process"""
+        cmd = self._build_cmd('explore_styles', 'styles')
+        self._add_common_options(cmd, 'styles')
         
         self.start_process(cmd, "Style Exploration")
     
@@ -1222,16 +1672,7 @@ class AppleStyleGUI:
         """Run explore_narrative process"""
         selected_images = self.get_image_list('selected_images_narrative')
         
-        cmd = [
-            sys.executable, self.gpu_script_path, 'explore_narrative',
-            '--project', self.project_var.get(),
-            '--guidance', self.param_vars['guidance_narrative'].get(),
-            '--dream-count', str(self.param_vars['dream_count_narrative'].get()),
-            '--seed-count', str(self.param_vars['seed_count_narrative'].get()),
-            '--creativity', str(self.param_vars['creativity_narrative'].get()),
-            '--width', str(self.param_vars['width_narrative'].get()),
-            '--height', str(self.param_vars['height_narrative'].get()),
-        ]
+        cmd = self._build_cmd('explore_narrative', 'narrative')
         
         if selected_images:
             cmd.extend(['--selected-images'] + selected_images)
@@ -1239,16 +1680,7 @@ class AppleStyleGUI:
         if self.param_vars['per_image_narrative'].get():
             cmd.append('--per-image')
         
-        if self.param_vars['keep_comfyui_running_narrative'].get():
-            cmd.append('--keep-comfyui-running')
-        
-        # Handle wildcards
-        wildcard_selection = self.param_vars['wildcards_narrative'].get()
-        if wildcard_selection and wildcard_selection != "None":
-            if wildcard_selection == "All Wildcards":
-                cmd.extend(['--wildcards'])  # Empty wildcards means use all
-            else:
-                cmd.extend(['--wildcards', wildcard_selection])
+        self._add_common_options(cmd, 'narrative')
         
         self.start_process(cmd, "Narrative Exploration")
     
@@ -1261,31 +1693,9 @@ class AppleStyleGUI:
                                  "Please select at least one style reference image")
             return
         
-        cmd = [
-            sys.executable, self.gpu_script_path, 'refine_styles',
-            '--project', self.project_var.get(),
-            '--prompt', self.param_vars['prompt_refine'].get(),
-            '--guidance', self.param_vars['guidance_refine'].get(),
-            '--dream-count', str(self.param_vars['dream_count_refine'].get()),
-            '--test-count', str(self.param_vars['test_count_refine'].get()),
-            '--k', str(self.param_vars['k_refine'].get()),
-            '--creativity', str(self.param_vars['creativity_refine'].get()),
-            '--width', str(self.param_vars['width_refine'].get()),
-            '--height', str(self.param_vars['height_refine'].get()),
-            '--strength-min', str(self.param_vars['strength_min_refine'].get()),
-            '--strength-max', str(self.param_vars['strength_max_refine'].get()),
-            '--selected-styles'] + selected_styles
-        
-        if self.param_vars['keep_comfyui_running_refine'].get():
-            cmd.append('--keep-comfyui-running')
-        
-        # Handle wildcards
-        wildcard_selection = self.param_vars['wildcards_refine'].get()
-        if wildcard_selection and wildcard_selection != "None":
-            if wildcard_selection == "All Wildcards":
-                cmd.extend(['--wildcards'])  # Empty wildcards means use all
-            else:
-                cmd.extend(['--wildcards', wildcard_selection])
+        cmd = self._build_cmd('refine_styles', 'refine')
+        cmd.extend(['--selected-styles'] + selected_styles)
+        self._add_common_options(cmd, 'refine')
         
         self.start_process(cmd, "Style Refinement")
     
@@ -1297,71 +1707,133 @@ class AppleStyleGUI:
         
         self.run_btn.configure(state='disabled')
         self.stop_btn.configure(state='normal')
-        self.status_var.set(f"Initializing {process_name}...")
-        self.overall_progress['value'] = 0
-        self.current_progress.start()
+        self._cancel_progress_flush()
+        self.invalidate_queue_status()
+        self.write_status(f"Initializing {process_name}...")
+        self.set_progress_value(0)
+        self.set_job_activity(True)
         
         # Track processing phase and job counts
         self.processing_phase = "initializing"
         self.total_jobs = 0
         self.completed_jobs = 0
         
-        # Start process in background thread
-        def run_process():
-            try:
-                self.current_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    universal_newlines=True,
-                    bufsize=1
-                )
-                
-                # Read output line by line with enhanced parsing
-                while True:
-                    output = self.current_process.stdout.readline()
-                    if output == '' and self.current_process.poll() is not None:
-                        break
-                    if output:
-                        self.root.after(0, lambda text=output.strip(): self.parse_and_log_output(text))
-                
-                return_code = self.current_process.wait()
-                
-                if return_code == 0:
-                    self.root.after(0, lambda: self.process_completed(process_name, True))
-                else:
-                    self.root.after(0, lambda: self.process_completed(process_name, False))
-                    
-            except Exception as e:
-                self.root.after(0, lambda: self.process_error(process_name, str(e)))
-        
-        self.monitoring_thread = threading.Thread(target=run_process)
-        self.monitoring_thread.daemon = True
-        self.monitoring_thread.start()
+        # Run the process on the shared asyncio loop; output is drained in batches
+        # by a single _drain_output loop, so drop one left over from the last run.
+        # Each run gets its own buffer so a stopped run's late output stays out of it
+        if self._drain_after_id is not None:
+            self.root.after_cancel(self._drain_after_id)
+        self._run_generation += 1
+        self._output_lines = deque()
+        asyncio.run_coroutine_threadsafe(
+            self._run_process_async(cmd, process_name, self._run_generation, self._output_lines),
+            self._ensure_event_loop())
+        self._drain_after_id = self.root.after(OUTPUT_DRAIN_MS, self._drain_output)
+    
+    def _ensure_event_loop(self):
+        """Start the asyncio loop thread shared by all process runs on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self.monitoring_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self.monitoring_thread.start()
+        return self._loop
+    
+    async def _run_process_async(self, cmd, process_name, generation, output):
+        """Run cmd on the event loop, buffering its output lines in output for the Tk thread"""
+        process = None
+        try:
+            process = self.current_process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+            
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            buffer = ''
+            while True:
+                chunk = await process.stdout.read(OUTPUT_READ_SIZE)
+                buffer += decoder.decode(chunk, final=not chunk)
+                if not chunk:
+                    break
+                # A trailing '\r' may be the first half of a '\r\n' split across reads
+                hold = '\r' if buffer.endswith('\r') else ''
+                lines = LINE_BREAK_PATTERN.split(buffer[:len(buffer) - len(hold)])
+                buffer = lines.pop() + hold
+                if len(buffer) >= OUTPUT_MAX_LINE:
+                    lines.append(buffer)
+                    buffer = ''
+                output.extend(line.strip() for line in lines)
+            
+            lines = LINE_BREAK_PATTERN.split(buffer)
+            if not lines[-1]:
+                lines.pop()  # Output ended with a line break
+            output.extend(line.strip() for line in lines)
+            
+            return_code = await process.wait()
+            self.root.after(0, self._finish_process, generation, process_name, return_code == 0)
+            
+        except Exception as e:
+            # Don't leave the child running with nobody reading its output
+            if process is not None and process.returncode is None:
+                process.terminate()
+            self.root.after(0, self._finish_process, generation, process_name, False, str(e))
+    
+    def _drain_output(self, limit=OUTPUT_DRAIN_MAX_LINES):
+        """Parse and log up to limit buffered output lines in one Tk callback"""
+        self._drain_after_id = None
+        lines = []
+        while self._output_lines and (limit is None or len(lines) < limit):
+            lines.append(self._output_lines.popleft())
+        if lines:
+            for line in lines:
+                self.parse_output(line)
+            if self._output_lines and not self._console_unwrapped:
+                # More output is queued: skip word-wrap layout until the burst is over
+                self.console_text.configure(wrap='none')
+                self._console_unwrapped = True
+            self.log_to_console("\n".join(lines))
+        if self._console_unwrapped and not self._output_lines:
+            self.console_text.configure(wrap='word')
+            self._console_unwrapped = False
+        
+        if self.processing_phase != "idle":
+            self._drain_after_id = self.root.after(OUTPUT_DRAIN_MS, self._drain_output)
+    
+    def _finish_process(self, generation, process_name, success, error_msg=None):
+        """Flush remaining output, then report completion of the current run"""
+        if generation != self._run_generation:
+            return  # Stopped or superseded run; its completion was already reported
+        self._drain_output(limit=None)
+        if error_msg is None:
+            self.process_completed(process_name, success)
+        else:
+            self.process_error(process_name, error_msg)
     
     def stop_current_process(self):
         """Stop the current process"""
-        if self.current_process and self.current_process.poll() is None:
-            self.current_process.terminate()
+        if self.current_process and self.current_process.returncode is None:
+            self._run_generation += 1  # The stopped run must not complete a later one
+            self._loop.call_soon_threadsafe(self.current_process.terminate)
             self.log_to_console("Process terminated by user")
             self.process_completed("Process", False)
     
     def process_completed(self, process_name, success):
         """Handle process completion"""
+        self._cancel_progress_flush()
+        self.invalidate_queue_status()
         self.run_btn.configure(state='normal')
         self.stop_btn.configure(state='disabled')
-        self.overall_progress['value'] = 100 if success else 0
-        self.current_progress.stop()
+        self.set_progress_value(100 if success else 0)
+        self.set_job_activity(False)
         
         if success:
-            self.status_var.set(f"✅ {process_name} completed successfully!")
+            self.write_status(f"✅ {process_name} completed successfully!")
             self.log_to_console("="*60)
             self.log_to_console(f"✅ {process_name} COMPLETED SUCCESSFULLY")
             self.log_to_console(f"Total jobs processed: {self.completed_jobs}/{self.total_jobs}")
             self.log_to_console("="*60)
         else:
-            self.status_var.set(f"❌ {process_name} failed or was stopped")
+            self.write_status(f"❌ {process_name} failed or was stopped")
             self.log_to_console("="*60)
             self.log_to_console(f"❌ {process_name} FAILED OR STOPPED")
             self.log_to_console("="*60)
@@ -1371,133 +1843,191 @@ class AppleStyleGUI:
     
     def process_error(self, process_name, error_msg):
         """Handle process error"""
+        self._cancel_progress_flush()
+        self.invalidate_queue_status()
         self.run_btn.configure(state='normal')
         self.stop_btn.configure(state='disabled')
-        self.overall_progress['value'] = 0
-        self.current_progress.stop()
-        self.status_var.set(f"{process_name} error")
+        self.set_progress_value(0)
+        self.set_job_activity(False)
+        self.write_status(f"{process_name} error")
         self.log_to_console(f"\n❌ {process_name} error: {error_msg}")
         self.current_process = None
+        self.processing_phase = "idle"
+    
+    def set_progress_value(self, value):
+        """Write the overall progress bar immediately"""
+        self.overall_progress['value'] = value
+        self._shown_progress = value
+    
+    def write_status(self, status_text):
+        """Write the status label immediately"""
+        self.status_var.set(status_text)
+        self._shown_status = status_text
+    
+    def set_job_activity(self, running):
+        """Start or stop the current-job animation, skipping calls that change nothing"""
+        if running == self._indeterminate_running:
+            return
+        if running:
+            self.current_progress.start()
+        else:
+            self.current_progress.stop()
+        self._indeterminate_running = running
     
     def update_overall_progress(self, percentage, status_text=None):
-        """Update the overall progress bar"""
-        self.overall_progress['value'] = min(100, max(0, percentage))
+        """Update the overall progress bar (applied on the next progress flush)"""
+        self._pending_progress = min(100, max(0, percentage))
         if status_text:
-            self.status_var.set(status_text)
+            self._pending_status = status_text
+        self._schedule_progress_flush()
     
-    def parse_and_log_output(self, message):
-        """Parse output for status updates and log to console"""
-        import re
+    def set_status(self, status_text):
+        """Update the status label (applied on the next progress flush)"""
+        self._pending_status = status_text
+        self._schedule_progress_flush()
+    
+    def _schedule_progress_flush(self):
+        """Refresh progress widgets within PROGRESS_FLUSH_MS, coalescing updates until then"""
+        if self._progress_after_id is None:
+            self._progress_after_id = self.root.after(PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Copy the latest pending progress and status into the widgets"""
+        self._progress_after_id = None
+        if self._pending_progress is not None:
+            # Sub-half-percent moves aren't visible; skip the widget write and redraw
+            if abs(self._pending_progress - self._shown_progress) >= 0.5:
+                self.set_progress_value(self._pending_progress)
+            self._pending_progress = None
+        if self._pending_status is not None:
+            if self._pending_status != self._shown_status:
+                self.write_status(self._pending_status)
+            self._pending_status = None
+    
+    def _cancel_progress_flush(self):
+        """Drop pending progress updates so they can't overwrite a final state"""
+        if self._progress_after_id is not None:
+            self.root.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
+        self._pending_progress = None
+        self._pending_status = None
+    
+    def parse_output(self, message):
+        """Parse a line of process output for phase and progress updates"""
+        kind, *values = classify_output_line(message)
         
         # Detect processing phases
-        if "PHASE 1: LLM INFERENCE" in message:
+        if kind == 'llm_phase':
             self.processing_phase = "llm"
-            self.status_var.set("LLM Generation Phase - Creating prompts...")
+            self.set_status("LLM Generation Phase - Creating prompts...")
             self.update_overall_progress(10, "LLM: Generating prompts")
-            self.current_progress.start()
+            self.set_job_activity(True)
             
-        elif "PHASE 2: IMAGE GENERATION" in message:
+        elif kind == 'comfyui_phase':
             self.processing_phase = "comfyui"
-            self.status_var.set("ComfyUI Phase - Starting image generation...")
+            self.set_status("ComfyUI Phase - Starting image generation...")
             self.update_overall_progress(30, "ComfyUI: Initializing batch")
-            self.current_progress.start()
+            self.set_job_activity(True)
             
-        elif "PHASE 3: CLEANUP" in message:
+        elif kind == 'cleanup_phase':
             self.processing_phase = "cleanup"
-            self.status_var.set("Cleaning up...")
+            self.set_status("Cleaning up...")
             self.update_overall_progress(95, "Finalizing")
-            self.current_progress.stop()
+            self.set_job_activity(False)
         
         # Track batch submission
-        elif "BATCH SUBMISSION PHASE" in message:
-            self.status_var.set("ComfyUI: Submitting batch jobs...")
+        elif kind == 'batch_submission':
+            self.set_status("ComfyUI: Submitting batch jobs...")
             self.update_overall_progress(35)
             
-        elif "Submission Summary" in message:
+        elif kind == 'submission_summary':
             # Extract total jobs from submission summary
-            self.status_var.set("ComfyUI: Jobs submitted, processing...")
+            self.set_status("ComfyUI: Jobs submitted, processing...")
             self.update_overall_progress(40)
         
         # Track successful submissions
-        elif "Successfully submitted:" in message:
-            match = re.search(r'Successfully submitted: (\d+)', message)
-            if match:
-                self.total_jobs = int(match.group(1))
-                self.status_var.set(f"ComfyUI: Processing batch ({self.total_jobs} jobs)")
+        elif kind == 'submitted':
+            self.total_jobs = values[0]
+            self.set_status(f"ComfyUI: Processing batch ({self.total_jobs} jobs)")
         
         # Track job completions with detailed progress
-        elif "Job" in message and "completed" in message:
-            match = re.search(r'\((\d+)/(\d+)\)', message)
-            if match:
-                self.completed_jobs = int(match.group(1))
-                total = int(match.group(2))
-                self.total_jobs = total
-                
-                # Calculate progress (40% to 95% range for ComfyUI phase)
-                if total > 0:
-                    job_progress = (self.completed_jobs / total) * 55  # 55% of total progress bar
-                    overall = 40 + job_progress  # Start at 40%, end at 95%
-                    self.update_overall_progress(overall)
-                    self.status_var.set(f"ComfyUI: Processing batch ({self.completed_jobs}/{total})")
+        elif kind == 'job_completed':
+            self.completed_jobs, total = values
+            self.total_jobs = total
+            
+            # Calculate progress (40% to 95% range for ComfyUI phase)
+            if total > 0:
+                job_progress = (self.completed_jobs / total) * 55  # 55% of total progress bar
+                overall = 40 + job_progress  # Start at 40%, end at 95%
+                self.update_overall_progress(overall)
+                self.set_status(f"ComfyUI: Processing batch ({self.completed_jobs}/{total})")
         
         # Track monitoring phase
-        elif "JOB MONITORING PHASE" in message:
-            self.status_var.set("ComfyUI: Monitoring job progress...")
-        
-        # Log to console with proper Unicode encoding
-        self.log_to_console(message)
+        elif kind == 'monitoring':
+            self.set_status("ComfyUI: Monitoring job progress...")
     
     def log_to_console(self, message):
         """Log message to console output with proper Unicode support"""
         try:
             # Ensure proper Unicode display
             self.console_text.insert(tk.END, message + "\n", ())
-            self.console_text.see(tk.END)
-            self.console_text.update()
         except Exception as e:
             # Fallback for any encoding issues
             safe_message = message.encode('utf-8', errors='replace').decode('utf-8')
             self.console_text.insert(tk.END, safe_message + "\n")
-            self.console_text.see(tk.END)
-            self.console_text.update()
+        
+        # Drop the oldest lines in blocks so the widget never grows without bound
+        line_count = int(self.console_text.index('end-1c').split('.')[0])
+        if line_count > CONSOLE_MAX_LINES:
+            excess = line_count - CONSOLE_MAX_LINES + CONSOLE_TRIM_LINES
+            self.console_text.delete('1.0', f'{excess + 1}.0')
+        self.console_text.see(tk.END)
+    
+    def get_queue_status(self, ttl=QUEUE_STATUS_TTL):
+        """Return the agent's 'queue status' output, reusing a result younger than ttl seconds"""
+        timestamp, stdout = self._queue_status_cache
+        if stdout is not None and time.monotonic() - timestamp < ttl:
+            return stdout
+        
+        cmd = [sys.executable, self.gpu_script_path, 'queue', 'status']
+        # Run with UTF-8 encoding
+        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+        self._queue_status_cache = (time.monotonic(), result.stdout)
+        return result.stdout
+    
+    def invalidate_queue_status(self):
+        """Forget the cached queue status, e.g. once a run has changed the queue"""
+        self._queue_status_cache = (0.0, None)
     
     def show_queue_status(self):
         """Show batch queue status with proper Unicode display"""
-        cmd = [sys.executable, self.gpu_script_path, 'queue', 'status']
         try:
-            # Run with UTF-8 encoding
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
+            status_text = self.get_queue_status()
             
             # Create popup window
             popup = tk.Toplevel(self.root)
             popup.title("Queue Status")
             popup.geometry("700x500")
-            popup.configure(bg=self.colors['bg'])
+            popup.configure(bg=self._c_bg)
             
             # Text widget for status
-            text_frame = ttk.Frame(popup, style="Apple.TFrame")
+            text_frame = ttk.Frame(popup)
             text_frame.pack(fill='both', expand=True, padx=20, pady=20)
             
             text_widget = ScrolledText(text_frame, 
-                                      bg=self.colors['card_bg'],
-                                      fg=self.colors['text'],
-                                      font=('Courier', 10),
-                                      insertbackground=self.colors['text'],
-                                      selectbackground=self.colors['accent'],
+                                      bg=self._c_card_bg,
+                                      fg=self._c_text,
+                                      font=self.fonts['mono'],
+                                      insertbackground=self._c_text,
+                                      selectbackground=self._c_accent,
                                       selectforeground='white',
                                       borderwidth=1,
                                       highlightthickness=0,
                                       wrap='word')
             text_widget.pack(fill='both', expand=True)
             
-            # Insert text with proper Unicode handling
-            try:
-                text_widget.insert('1.0', result.stdout)
-            except:
-                # Fallback if there are encoding issues
-                safe_text = result.stdout.encode('utf-8', errors='replace').decode('utf-8')
-                text_widget.insert('1.0', safe_text)
-            
+            # Output was decoded as UTF-8 by subprocess.run, so it is already a str
+            text_widget.insert('1.0', status_text or '')
             text_widget.config(state='disabled')  # Make read-only
             
         except Exception as e:
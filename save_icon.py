@@ -6,10 +6,14 @@ Helper script to save the MuseVision icon from screenshot or image file
 import os
 import sys
 import shutil
+import time
 from pathlib import Path
 
+# Image types offered as icon candidates
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg')
+
 def save_icon():
-    musevision_dir = Path("/home/mitchellflautt/MuseVision")
+    musevision_dir = Path(__file__).resolve().parent
     assets_dir = musevision_dir / "gui" / "assets"
     target_path = assets_dir / "musevision_icon.png"
     
@@ -24,7 +28,7 @@ def save_icon():
         source_path = Path(sys.argv[1])
         if source_path.exists():
             try:
-                shutil.copy2(source_path, target_path)
+                shutil.copyfile(source_path, target_path)
                 print(f"✅ Icon saved successfully!")
                 print(f"   From: {source_path}")
                 print(f"   To: {target_path}")
@@ -52,19 +56,19 @@ def save_icon():
     
     print("🔍 Looking for recent image files...")
     recent_images = []
+    # Only offer images modified in the last hour
+    cutoff = time.time() - 3600
     
     for directory in screenshot_dirs:
-        if directory.exists():
-            try:
-                for pattern in ["*.png", "*.jpg", "*.jpeg"]:
-                    for file_path in directory.glob(pattern):
-                        if file_path.is_file():
-                            # Check if modified in last hour
-                            import time
-                            if time.time() - file_path.stat().st_mtime < 3600:
-                                recent_images.append(file_path)
-            except PermissionError:
-                continue
+        try:
+            # One pass per directory; only matching names are stat'ed
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if (entry.name.lower().endswith(IMAGE_EXTS) and entry.is_file()
+                            and entry.stat().st_mtime > cutoff):
+                        recent_images.append(Path(entry.path))
+        except OSError:
+            continue  # Missing or unreadable directory
     
     if recent_images:
         print(f"Found {len(recent_images)} recent image(s):")
@@ -84,7 +88,7 @@ def save_icon():
     
     if source_path.exists():
         try:
-            shutil.copy2(source_path, target_path)
+            shutil.copyfile(source_path, target_path)
             print(f"✅ Icon saved successfully!")
             print(f"   From: {source_path}")
             print(f"   To: {target_path}")